@@ -3,6 +3,7 @@
 애플리케이션 설정 파일
 """
 import os
+import functools
 from pathlib import Path
 
 
@@ -29,6 +30,10 @@ class AppSettings:
     DEFAULT_OCR_LANGUAGE = "kor+eng"
     MIN_OCR_CONFIDENCE = 30.0
     OCR_PREPROCESSING = True
+    MAX_OCR_RESULTS = 20  # 신뢰도 상위 몇 개의 후보만 반환/표시
+    TESSDATA_TMPFS = False  # True이면 언어 데이터를 /dev/shm에 복사해 사용 (Linux)
+    TESSDATA_TMPFS_DIR = "/dev/shm/sightbox-tessdata"
+    OCR_USE_OPENCL = False  # True이면 OCR 전처리를 OpenCL(UMat)로 수행 (측정 후 이득이 있을 때만)
     
     # UI 설정
     WINDOW_WIDTH = 1200
@@ -42,28 +47,44 @@ class AppSettings:
         return os.path.join("config", "user_list.txt")
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_dropbox_paths():
-        """가능한 Dropbox 경로들"""
+        """가능한 Dropbox 경로들 (최초 호출 시 한 번만 생성)"""
         home = Path.home()
-        return [
+        return (
             home / "Dropbox",
             home / "Dropbox (Personal)",
             home / "Dropbox (Business)",
             home / "OneDrive",  # 대안으로 OneDrive도 포함
             home / "PhotoCapture"  # 최종 대안
-        ]
+        )
     
     # Tesseract 경로 설정
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_tesseract_paths():
-        """가능한 Tesseract 실행 파일 경로들"""
-        return [
+        """가능한 Tesseract 실행 파일 경로들 (최초 호출 시 한 번만 생성)"""
+        return (
             r"C:\Program Files\Tesseract-OCR\tesseract.exe",
             r"C:\Program Files (x86)\Tesseract-OCR\tesseract.exe",
             "/usr/bin/tesseract",
             "/opt/homebrew/bin/tesseract",
             "tesseract"  # PATH에 있는 경우
-        ]
+        )
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def get_tessdata_paths():
+        """가능한 Tesseract 언어 데이터(tessdata) 경로들 (최초 호출 시 한 번만 생성)"""
+        return tuple(p for p in (
+            os.environ.get('TESSDATA_PREFIX', ''),  # 사용자가 지정한 경로 우선
+            "/usr/share/tesseract-ocr/5/tessdata",
+            "/usr/share/tesseract-ocr/4.00/tessdata",
+            "/usr/share/tessdata",
+            "/usr/local/share/tessdata",
+            "/opt/homebrew/share/tessdata",
+            r"C:\Program Files\Tesseract-OCR\tessdata",
+        ) if p)
 
 
 # config/user_list.txt (예시 내용)
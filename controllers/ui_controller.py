@@ -2,15 +2,23 @@
 """
 UI 컨트롤러 - UI와 비즈니스 로직을 연결
 """
+import queue
+import logging
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import List, Optional
 from datetime import datetime
+import cv2
 import numpy as np
 
+from config.settings import AppSettings
 from strategies.base.camera_strategy import CameraStrategy
 from strategies.base.ocr_strategy import OCRStrategy, OCRResult
-from strategies.base.storage_strategy import StorageStrategy
+from strategies.base.storage_strategy import StorageStrategy, StorageResult
 from strategies.base.filename_strategy import FilenameStrategy
 
+log = logging.getLogger(__name__)
+
 
 class UIController:
     """UI와 전략들을 연결하는 컨트롤러"""
@@ -23,9 +31,18 @@ class UIController:
         self.filename_strategy = filename_strategy
         
         self.current_image: Optional[np.ndarray] = None
+        self._gray_image: Optional[np.ndarray] = None  # current_image의 그레이스케일 (OCR 입력으로 공유)
         self.ocr_results: List[OCRResult] = []
         self.users: List[str] = []
         
+        # 촬영 시점에 미리 계산해 두는 저장 정보
+        self._pending_timestamp: Optional[datetime] = None
+        self._pending_folder_name: Optional[str] = None
+        
+        # 백그라운드 저장 (인코딩 + 디스크 쓰기를 UI 스레드에서 분리)
+        self._save_executor = ThreadPoolExecutor(max_workers=2)
+        self._save_results: "queue.Queue[StorageResult]" = queue.Queue()
+        
         # 카메라 초기화
         self.initialize_camera()
         
@@ -45,50 +62,101 @@ class UIController:
         image = self.camera_strategy.capture_photo()
         if image is not None:
             self.current_image = image
+            # 그레이스케일 변환은 한 번만 수행하고 OCR에서 재사용
+            self._gray_image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+            # 촬영 시각 기준 폴더명을 미리 계산 (저장 시에는 파일명만 생성)
+            self._pending_timestamp = datetime.now()
+            self._pending_folder_name = self.filename_strategy.generate_folder_name(self._pending_timestamp)
             return True
         return False
     
+    def discard_capture(self) -> None:
+        """현재 촬영 이미지 폐기 (저장하지 않고 다시 촬영)"""
+        self.current_image = None
+        self._gray_image = None
+        self._pending_timestamp = None
+        self._pending_folder_name = None
+        self.ocr_results = []
+    
     def analyze_image_ocr(self) -> List[OCRResult]:
         """현재 이미지에 대해 OCR 수행"""
         if self.current_image is None:
             return []
         
-        self.ocr_results = self.ocr_strategy.extract_text(self.current_image)
+        image = self._gray_image if self._gray_image is not None else self.current_image
+        self.ocr_results = self.ocr_strategy.extract_text(image)
         return self.ocr_results
     
     def save_photo(self, user: str, ocr_content: str) -> bool:
-        """사진 저장"""
+        """
+        사진 저장 요청
+        실제 저장은 백그라운드에서 수행되며 결과는 get_save_results()로 확인
+        Args:
+            user: 사용자명
+            ocr_content: 파일명에 사용할 OCR 내용
+        Returns:
+            bool: 저장 요청 성공 여부
+        """
         if self.current_image is None:
             return False
         
+        # 파일명 생성 (촬영 시각 기준, 폴더명은 capture_photo에서 계산됨)
+        timestamp = self._pending_timestamp or datetime.now()
+        folder_name = self._pending_folder_name or self.filename_strategy.generate_folder_name(timestamp)
+        filename = self.filename_strategy.generate_filename(user, ocr_content, timestamp)
+        
+        # 백그라운드 저장 (폴더명과 파일명은 저장 전략이 한 번에 결합)
+        # current_image는 다음 촬영 시 새 배열로 교체될 뿐 수정되지 않으므로 참조만 넘김
+        # 결과가 어느 촬영의 것인지 알 수 있도록 촬영 시각을 메타데이터로 전달
+        metadata = {'captured_at': timestamp}
+        future = self._save_executor.submit(self.storage_strategy.save_image, self.current_image,
+                                            filename, metadata=metadata, subdir=folder_name)
+        future.add_done_callback(functools.partial(self._on_save_done, metadata))
+        
+        return True
+    
+    def _on_save_done(self, metadata: dict, future: Future) -> None:
+        """백그라운드 저장 완료 콜백"""
         try:
-            # 파일명 생성
-            timestamp = datetime.now()
-            filename = self.filename_strategy.generate_filename(user, ocr_content, timestamp)
-            
-            # 폴더명 생성
-            folder_name = self.filename_strategy.generate_folder_name(timestamp)
-            
-            # 전체 경로 생성
-            file_path = f"{folder_name}/{filename}"
-            
-            # 저장
-            result = self.storage_strategy.save_image(self.current_image, file_path)
-            
-            return result.success
-            
+            result = future.result()
         except Exception as e:
-            print(f"사진 저장 중 오류: {e}")
-            return False
+            result = StorageResult(success=False, error_message=f"저장 중 오류: {e}")
+        # 실패 결과에도 촬영 정보를 붙임
+        result.metadata = {**metadata, **result.metadata}
+        
+        if not result.success:
+            log.error("사진 저장 중 오류: %s", result.error_message)
+        self._save_results.put(result)
+    
+    def get_save_results(self) -> List[StorageResult]:
+        """완료된 저장 결과들을 꺼내서 반환"""
+        results = []
+        while True:
+            try:
+                results.append(self._save_results.get_nowait())
+            except queue.Empty:
+                return results
     
-    def load_users(self) -> List[str]:
-        """사용자 목록 로드"""
+    def is_current_capture(self, result: StorageResult) -> bool:
+        """저장 결과가 현재 촬영 이미지에 대한 것인지 확인 (이후 새로 촬영하지 않았는지)"""
+        return (self.current_image is not None and
+                result.metadata.get('captured_at') == self._pending_timestamp)
+    
+    def load_users(self, force: bool = False) -> List[str]:
+        """
+        사용자 목록 로드
+        파일이 변경되지 않았으면 FileUtils의 캐시된 목록을 사용
+        Args:
+            force: True이면 캐시를 무시하고 다시 읽음
+        Returns:
+            List[str]: 사용자 목록
+        """
         try:
             from utils.file_utils import FileUtils
-            self.users = FileUtils.load_user_list()
+            self.users = FileUtils.load_user_list(AppSettings.get_user_list_path(), force=force)
             return self.users
-        except Exception as e:
-            print(f"사용자 목록 로드 실패: {e}")
+        except Exception:
+            log.exception("사용자 목록 로드 실패")
             self.users = ["기본사용자"]
             return self.users
     
@@ -111,6 +179,8 @@ class UIController:
     def release_resources(self) -> None:
         """리소스 해제"""
         self.camera_strategy.release()
+        # 진행 중인 저장은 끝까지 완료
+        self._save_executor.shutdown(wait=True)
 
 
 # utils/file_utils.py
@@ -118,39 +188,59 @@ class UIController:
 파일 관련 유틸리티 함수들
 """
 import os
+import logging
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Tuple
+
+log = logging.getLogger(__name__)
+
+
+# 파일명에 사용할 수 없는 문자 제거용 변환 테이블 (제어 문자 0x00-0x1f 포함)
+_BAD = dict.fromkeys(list(range(0x20)) + [ord(c) for c in '<>:"/\\|?*'], None)
+
+# 사용자 목록 캐시: {파일 경로: (st_mtime_ns, 사용자 목록)}
+_USER_LIST_CACHE: Dict[str, Tuple[int, List[str]]] = {}
 
 
 class FileUtils:
     """파일 관련 유틸리티 클래스"""
     
     @staticmethod
-    def load_user_list(file_path: str = "config/user_list.txt") -> List[str]:
+    def load_user_list(file_path: str = "config/user_list.txt", force: bool = False) -> List[str]:
         """
         사용자 목록 파일에서 사용자 목록 로드
+        파일의 수정 시각이 바뀌지 않았으면 캐시된 목록을 반환
         Args:
             file_path: 사용자 목록 파일 경로
+            force: True이면 캐시를 무시하고 파일을 다시 읽음
         Returns:
             List[str]: 사용자 목록
         """
         users = []
         
         try:
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        user = line.strip()
-                        if user and not user.startswith('#'):  # 주석 제외
-                            users.append(user)
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
+                st = None
+            
+            if st is not None:
+                cached = None if force else _USER_LIST_CACHE.get(file_path)
+                if cached is not None and cached[0] == st.st_mtime_ns:
+                    users = list(cached[1])
+                else:
+                    lines = Path(file_path).read_text(encoding='utf-8').splitlines()
+                    # 빈 줄과 주석 제외
+                    users = [s for s in (l.strip() for l in lines) if s and not s.startswith('#')]
+                    _USER_LIST_CACHE[file_path] = (st.st_mtime_ns, list(users))
             else:
                 # 파일이 없으면 기본 사용자 목록 생성
                 default_users = ["김철수", "이영희", "박민수", "최은정"]
                 FileUtils.save_user_list(default_users, file_path)
                 users = default_users
                 
-        except Exception as e:
-            print(f"사용자 목록 로드 실패: {e}")
+        except Exception:
+            log.exception("사용자 목록 로드 실패")
             users = ["기본사용자"]
         
         return users if users else ["기본사용자"]
@@ -169,16 +259,16 @@ class FileUtils:
             # 디렉토리 생성
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write("# 사용자 목록 파일\n")
-                f.write("# 한 줄에 한 사용자씩 작성하세요\n\n")
-                for user in users:
-                    f.write(f"{user}\n")
+            body = ("# 사용자 목록 파일\n"
+                    "# 한 줄에 한 사용자씩 작성하세요\n\n"
+                    + "\n".join(users) + "\n")
+            Path(file_path).write_text(body, encoding='utf-8')
+            _USER_LIST_CACHE.pop(file_path, None)
             
             return True
             
-        except Exception as e:
-            print(f"사용자 목록 저장 실패: {e}")
+        except Exception:
+            log.exception("사용자 목록 저장 실패")
             return False
     
     @staticmethod
@@ -193,8 +283,8 @@ class FileUtils:
         try:
             Path(directory_path).mkdir(parents=True, exist_ok=True)
             return True
-        except Exception as e:
-            print(f"디렉토리 생성 실패: {e}")
+        except Exception:
+            log.exception("디렉토리 생성 실패")
             return False
     
     @staticmethod
@@ -206,10 +296,9 @@ class FileUtils:
         Returns:
             str: 안전한 파일명
         """
-        import re
         # 파일명에 사용할 수 없는 문자들 제거
-        safe_filename = re.sub(r'[<>:"/\\|?*\x00-\x1f]', '', filename)
-        safe_filename = re.sub(r'\s+', ' ', safe_filename).strip()
+        safe_filename = filename.translate(_BAD)
+        safe_filename = ' '.join(safe_filename.split())
         
         # 길이 제한
         if len(safe_filename) > 200:
@@ -223,10 +312,38 @@ class FileUtils:
 """
 날짜 관련 유틸리티 함수들
 """
+import re
+import functools
 from datetime import datetime
 from typing import Tuple
 
 
+# 파일명 내 yymmdd 날짜 패턴
+_DATE_RE = re.compile(r'(\d{6})')
+
+
+@functools.lru_cache(maxsize=16)
+def _folder_name(year: int, month: int) -> str:
+    """(연, 월)별 폴더명 - strftime 없이 생성하고 결과를 캐시"""
+    return f"{year % 100:02d}년 {month:02d}월"
+
+
+def _yymmdd(ts: datetime) -> str:
+    return f"{ts.year % 100:02d}{ts.month:02d}{ts.day:02d}"
+
+
+def _iso(ts: datetime) -> str:
+    return f"{ts.year:04d}-{ts.month:02d}-{ts.day:02d}"
+
+
+def _full(ts: datetime) -> str:
+    return ts.strftime("%Y년 %m월 %d일 %H시 %M분")
+
+
+# format_type별 날짜 문자열 생성 함수
+_FMT = {"yymmdd": _yymmdd, "yyyy-mm-dd": _iso, "full": _full}
+
+
 class DateUtils:
     """날짜 관련 유틸리티 클래스"""
     
@@ -242,7 +359,7 @@ class DateUtils:
         if timestamp is None:
             timestamp = datetime.now()
         
-        return timestamp.strftime("%y년 %m월")
+        return _folder_name(timestamp.year, timestamp.month)
     
     @staticmethod
     def get_date_string(timestamp: datetime = None, format_type: str = "yymmdd") -> str:
@@ -257,14 +374,7 @@ class DateUtils:
         if timestamp is None:
             timestamp = datetime.now()
         
-        if format_type == "yymmdd":
-            return timestamp.strftime("%y%m%d")
-        elif format_type == "yyyy-mm-dd":
-            return timestamp.strftime("%Y-%m-%d")
-        elif format_type == "full":
-            return timestamp.strftime("%Y년 %m월 %d일 %H시 %M분")
-        else:
-            return timestamp.strftime("%y%m%d")
+        return _FMT.get(format_type, _yymmdd)(timestamp)
     
     @staticmethod
     def parse_date_from_filename(filename: str) -> Tuple[bool, datetime]:
@@ -275,12 +385,9 @@ class DateUtils:
         Returns:
             Tuple[bool, datetime]: (성공 여부, 추출된 날짜)
         """
-        import re
-        
         try:
             # yymmdd 형식 찾기
-            pattern = r'(\d{6})'
-            match = re.search(pattern, filename)
+            match = _DATE_RE.search(filename)
             
             if match:
                 date_str = match.group(1)
@@ -5,25 +5,21 @@
 """
 import sys
 import os
-from PyQt5.QtWidgets import QApplication, QMessageBox
-from PyQt5.QtCore import Qt
+import shutil
+import logging
+import subprocess
+import importlib.util
 
 # 프로젝트 루트 디렉토리를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# 전략 구현체들 import
-from strategies.camera.opencv_camera import OpenCVCamera
-from strategies.ocr.tesseract_ocr import TesseractOCR
-from strategies.storage.dropbox_local import DropboxLocal
-from strategies.filename.standard_naming import StandardNaming
-
-# 컨트롤러와 UI import
-from controllers.ui_controller import UIController
-from ui.main_window import MainWindow
-
-# 유틸리티 import
+# 설정 및 유틸리티 import
+# (PyQt5, OpenCV, pytesseract 등 무거운 모듈은 의존성 검사 이후에 import)
+from config.settings import AppSettings
 from utils.file_utils import FileUtils
 
+log = logging.getLogger(__name__)
+
 
 class PhotoCaptureApp:
     """사진 촬영 애플리케이션 메인 클래스"""
@@ -32,15 +28,22 @@ class PhotoCaptureApp:
         self.app = None
         self.main_window = None
         self.controller = None
+        self.tesseract_cmd = None
     
     def initialize_strategies(self):
         """전략 객체들 초기화"""
         try:
+            # 전략 구현체들 import (cv2 등은 이 시점에 처음 로드됨)
+            from strategies.camera.opencv_camera import OpenCVCamera
+            from strategies.ocr.tesseract_ocr import TesseractOCR
+            from strategies.storage.dropbox_local import DropboxLocal
+            from strategies.filename.standard_naming import StandardNaming
+            
             # 카메라 전략 (OpenCV 기반)
             camera_strategy = OpenCVCamera(camera_index=0)
             
             # OCR 전략 (Tesseract 기반)
-            ocr_strategy = TesseractOCR(language='kor+eng')
+            ocr_strategy = TesseractOCR(language='kor+eng', tesseract_cmd=self.tesseract_cmd)
             
             # 저장 전략 (Dropbox 로컬 폴더)
             storage_strategy = DropboxLocal()
@@ -50,51 +53,50 @@ class PhotoCaptureApp:
             
             return camera_strategy, ocr_strategy, storage_strategy, filename_strategy
             
-        except Exception as e:
-            print(f"전략 초기화 중 오류: {e}")
+        except Exception:
+            log.exception("전략 초기화 중 오류")
             return None, None, None, None
     
+    @staticmethod
+    def is_module_installed(module_name: str) -> bool:
+        """모듈을 import하지 않고 설치 여부만 확인"""
+        return importlib.util.find_spec(module_name) is not None
+    
+    def find_tesseract_cmd(self):
+        """
+        Tesseract 실행 파일 경로 탐색
+        존재하는 후보만 `--version`으로 확인하고 첫 성공에서 중단
+        """
+        for path in AppSettings.get_tesseract_paths():
+            cmd = path if os.path.isfile(path) else shutil.which(path)
+            if not cmd:
+                continue
+            try:
+                subprocess.run([cmd, '--version'], capture_output=True, timeout=2, check=True)
+                return cmd
+            except (subprocess.SubprocessError, OSError):
+                continue
+        return None
+    
     def check_dependencies(self):
         """필수 의존성 검사"""
         missing_deps = []
         
         # OpenCV 검사
-        try:
-            import cv2
-        except ImportError:
+        if not self.is_module_installed("cv2"):
             missing_deps.append("opencv-python")
         
         # Tesseract 검사
-        try:
-            import pytesseract
-            # Tesseract 실행 파일 검사
-            if not pytesseract.pytesseract.tesseract_cmd or not os.path.exists(pytesseract.pytesseract.tesseract_cmd):
-                # Windows에서 기본 경로 시도
-                possible_paths = [
-                    r"C:\Program Files\Tesseract-OCR\tesseract.exe",
-                    r"C:\Program Files (x86)\Tesseract-OCR\tesseract.exe",
-                    "tesseract"  # PATH에 있는 경우
-                ]
-                
-                tesseract_found = False
-                for path in possible_paths:
-                    try:
-                        pytesseract.pytesseract.tesseract_cmd = path
-                        pytesseract.image_to_string("test")
-                        tesseract_found = True
-                        break
-                    except:
-                        continue
-                
-                if not tesseract_found:
-                    missing_deps.append("tesseract-ocr (실행 파일)")
-        except ImportError:
+        if not self.is_module_installed("pytesseract"):
             missing_deps.append("pytesseract")
+        else:
+            # Tesseract 실행 파일 검사 (실제 엔진 확인은 첫 OCR 수행 시)
+            self.tesseract_cmd = self.find_tesseract_cmd()
+            if self.tesseract_cmd is None:
+                missing_deps.append("tesseract-ocr (실행 파일)")
         
         # PyQt5 검사
-        try:
-            from PyQt5.QtWidgets import QApplication
-        except ImportError:
+        if not self.is_module_installed("PyQt5"):
             missing_deps.append("PyQt5")
         
         return missing_deps
@@ -112,8 +114,8 @@ class PhotoCaptureApp:
             
             return True
             
-        except Exception as e:
-            print(f"디렉토리 설정 중 오류: {e}")
+        except Exception:
+            log.exception("디렉토리 설정 중 오류")
             return False
     
     def run(self):
@@ -133,6 +135,11 @@ class PhotoCaptureApp:
                 print("macOS: brew install tesseract tesseract-lang")
             return 1
         
+        from PyQt5.QtWidgets import QApplication, QMessageBox
+        from PyQt5.QtCore import Qt
+        from controllers.ui_controller import UIController
+        from ui.main_window import MainWindow
+        
         # PyQt5 애플리케이션 생성
         self.app = QApplication(sys.argv)
         self.app.setAttribute(Qt.AA_EnableHighDpiScaling)
@@ -176,8 +183,17 @@ class PhotoCaptureApp:
         return self.app.exec_()
 
 
+def setup_logging():
+    """로깅 설정"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+    )
+
+
 def main():
     """메인 함수"""
+    setup_logging()
     app = PhotoCaptureApp()
     return app.run()
 
@@ -189,8 +205,6 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         print("\n애플리케이션이 사용자에 의해 중단되었습니다.")
         sys.exit(0)
-    except Exception as e:
-        print(f"예상치 못한 오류가 발생했습니다: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        log.exception("예상치 못한 오류가 발생했습니다")
         sys.exit(1)
@@ -23,7 +23,10 @@ class CameraStrategy(ABC):
     @abstractmethod
     def get_frame(self) -> Optional[np.ndarray]:
         """
-        현재 프레임 가져오기
+        현재 프레임 가져오기 (미리보기용)
+        반환된 배열은 구현체의 캡처 버퍼를 그대로 참조할 수 있으며, 이후 프레임을 읽을 때
+        내용이 덮어써질 수 있음. 즉시 표시/변환에만 사용하고, 보관하거나 수정하려면
+        복사하거나 capture_photo()를 사용할 것
         Returns:
             Optional[np.ndarray]: 현재 프레임 이미지 (BGR 형식)
         """
@@ -34,7 +37,7 @@ class CameraStrategy(ABC):
         """
         사진 촬영
         Returns:
-            Optional[np.ndarray]: 촬영된 이미지 (BGR 형식)
+            Optional[np.ndarray]: 촬영된 이미지 (BGR 형식, 호출자가 소유하는 독립 배열)
         """
         pass
     
@@ -75,6 +78,8 @@ import numpy as np
 class OCRResult:
     """OCR 결과를 담는 데이터 클래스"""
     
+    __slots__ = ('text', 'confidence', 'bbox')
+    
     def __init__(self, text: str, confidence: float = 0.0, bbox: Optional[List[int]] = None):
         self.text = text.strip()
         self.confidence = confidence
@@ -92,7 +97,7 @@ class OCRStrategy(ABC):
         """
         이미지에서 텍스트 추출
         Args:
-            image: 입력 이미지 (BGR 또는 RGB 형식)
+            image: 입력 이미지 (BGR/RGB 또는 그레이스케일)
         Returns:
             List[OCRResult]: OCR 결과 리스트 (신뢰도 순으로 정렬)
         """
@@ -142,6 +147,8 @@ import numpy as np
 class StorageResult:
     """저장 결과를 담는 데이터 클래스"""
     
+    __slots__ = ('success', 'file_path', 'error_message', 'metadata')
+    
     def __init__(self, success: bool, file_path: Optional[str] = None, 
                  error_message: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None):
         self.success = success
@@ -161,13 +168,15 @@ class StorageStrategy(ABC):
     
     @abstractmethod
     def save_image(self, image: np.ndarray, file_path: str, 
-                   metadata: Optional[Dict[str, Any]] = None) -> StorageResult:
+                   metadata: Optional[Dict[str, Any]] = None,
+                   subdir: Optional[str] = None) -> StorageResult:
         """
         이미지 저장
         Args:
             image: 저장할 이미지
             file_path: 저장 경로 (상대 경로)
             metadata: 추가 메타데이터
+            subdir: 기본 경로 아래의 하위 폴더 (지정 시 file_path는 파일명)
         Returns:
             StorageResult: 저장 결과
         """
@@ -229,6 +238,8 @@ from datetime import datetime
 class FilenameComponents:
     """파일명 구성 요소를 담는 데이터 클래스"""
     
+    __slots__ = ('prefix', 'date_str', 'user', 'content', 'extension')
+    
     def __init__(self, prefix: str = "", date_str: str = "", user: str = "", 
                  content: str = "", extension: str = "jpg"):
         self.prefix = prefix
@@ -2,90 +2,262 @@
 """
 OpenCV 기반 카메라 구현체
 """
+import os
+import sys
+import threading
+import logging
 import cv2
 import numpy as np
 from typing import Optional, Tuple
 from strategies.base.camera_strategy import CameraStrategy
 
+log = logging.getLogger(__name__)
+
 
 class OpenCVCamera(CameraStrategy):
     """OpenCV를 사용한 카메라 구현체"""
     
+    # 캡처 스레드가 돌려 쓰는 프레임 버퍼 개수
+    FRAME_BUFFER_COUNT = 3
+    # 연속으로 이 횟수만큼 읽기에 실패하면 연결 끊김으로 판단
+    MAX_READ_FAILURES = 10
+    # release 시 캡처 스레드 종료를 기다리는 최대 시간 (초)
+    THREAD_JOIN_TIMEOUT = 1.0
+    
     def __init__(self, camera_index: int = 0):
         self.camera_index = camera_index
         self.cap: Optional[cv2.VideoCapture] = None
         self.is_initialized = False
+        
+        # 캡처 스레드가 갱신하는 최신 프레임 (단일 슬롯)
+        self._lock = threading.Lock()
+        self._latest: Optional[np.ndarray] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        
+        # 캡처 스레드가 갱신하는 연결 상태 (드라이버 호출 없이 조회)
+        self._connected = False
+        # initialize에서 협상된 해상도 (매 호출마다 드라이버에 묻지 않음)
+        self._resolution: Tuple[int, int] = (0, 0)
     
     def initialize(self) -> bool:
         """카메라 초기화"""
+        # 이전 캡처 스레드가 아직 읽기 중이면 두 번째 스레드를 띄우지 않음
+        if self._thread is not None and self._thread.is_alive():
+            log.warning("이전 카메라 캡처 스레드가 아직 종료되지 않음 - 초기화 생략")
+            return False
+        
         try:
-            self.cap = cv2.VideoCapture(self.camera_index)
+            # 플랫폼별 백엔드를 명시 (Windows: DirectShow, Linux: V4L2, 그 외: 자동)
+            if os.name == 'nt':
+                backend = cv2.CAP_DSHOW
+            elif sys.platform.startswith('linux'):
+                backend = cv2.CAP_V4L2
+            else:
+                backend = cv2.CAP_ANY
+            self.cap = cv2.VideoCapture(self.camera_index, backend)
+            if not self.cap.isOpened() and backend != cv2.CAP_ANY:
+                # 지정 백엔드로 열리지 않는 장치(예: MSMF 전용 웹캠)는 기본 백엔드로 재시도
+                log.info("카메라 백엔드 %d로 열기 실패 - 기본 백엔드로 재시도", backend)
+                self.cap.release()
+                self.cap = cv2.VideoCapture(self.camera_index)
             if not self.cap.isOpened():
                 return False
             
-            # 카메라 설정
+            # 카메라 설정 (MJPG 압축 포맷을 먼저 요청해 USB 대역폭 절감)
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
             self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
             self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
             self.cap.set(cv2.CAP_PROP_FPS, 30)
             
+            fourcc = int(self.cap.get(cv2.CAP_PROP_FOURCC))
+            log.info("카메라 픽셀 포맷: %s", "".join(chr((fourcc >> 8 * i) & 0xFF) for i in range(4)))
+            self._resolution = (int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                                int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+            
+            # 첫 프레임을 미리 읽어 슬롯을 채운 뒤 캡처 스레드 시작
+            ret, frame = self.cap.read()
+            self._latest = frame if ret else None
+            
             self.is_initialized = True
+            self._connected = True
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._capture_loop, daemon=True)
+            self._thread.start()
             return True
-        except Exception as e:
-            print(f"카메라 초기화 실패: {e}")
+        except Exception:
+            log.exception("카메라 초기화 실패")
             return False
     
+    def _capture_loop(self) -> None:
+        """캡처 스레드 - 최신 프레임만 보관하고 이전 프레임은 버림"""
+        # 미리 할당한 버퍼를 순환하며 재사용 (프레임마다 새 배열을 만들지 않음)
+        buffers = []
+        index = 0
+        failures = 0
+        while not self._stop_event.is_set():
+            if buffers:
+                ret, frame = self.cap.read(buffers[index])
+                index = (index + 1) % len(buffers)
+            else:
+                ret, frame = self.cap.read()
+                if ret:
+                    buffers = [np.empty_like(frame) for _ in range(self.FRAME_BUFFER_COUNT)]
+            with self._lock:
+                self._latest = frame if ret else None
+            if ret:
+                failures = 0
+                self._connected = True
+            else:
+                failures += 1
+                if failures >= self.MAX_READ_FAILURES:
+                    self._connected = False
+                self._stop_event.wait(0.01)
+    
     def get_frame(self) -> Optional[np.ndarray]:
-        """현재 프레임 가져오기"""
+        """
+        현재 프레임 가져오기
+        캡처 스레드의 순환 버퍼를 복사 없이 반환하므로 FRAME_BUFFER_COUNT - 1번 읽은 뒤 덮어써짐
+        (보관이 필요하면 capture_photo 사용)
+        """
         if not self.is_initialized or self.cap is None:
             return None
         
-        ret, frame = self.cap.read()
-        if ret:
-            return frame
-        return None
+        with self._lock:
+            return self._latest
     
     def capture_photo(self) -> Optional[np.ndarray]:
         """사진 촬영"""
-        return self.get_frame()
+        # 프레임 버퍼는 캡처 스레드가 재사용하므로 복사본을 반환
+        frame = self.get_frame()
+        return frame.copy() if frame is not None else None
     
     def release(self) -> None:
         """카메라 리소스 해제"""
-        if self.cap is not None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.THREAD_JOIN_TIMEOUT)
+            if self._thread.is_alive():
+                # 드라이버 read()에서 멈춘 스레드가 있는 동안 VideoCapture를 해제하면 안 됨
+                # (스레드는 daemon이므로 종료 시 함께 정리됨)
+                log.warning("카메라 캡처 스레드가 종료되지 않아 장치 해제를 생략")
+            else:
+                self._thread = None
+                if self.cap is not None:
+                    self.cap.release()
+        elif self.cap is not None:
             self.cap.release()
         self.is_initialized = False
+        self._connected = False
+        self._resolution = (0, 0)
+        
+        with self._lock:
+            self._latest = None
     
     def is_connected(self) -> bool:
         """카메라 연결 상태 확인"""
-        return self.is_initialized and self.cap is not None and self.cap.isOpened()
+        return self._connected
     
     def get_resolution(self) -> Tuple[int, int]:
         """카메라 해상도 가져오기"""
-        if not self.is_connected():
-            return (0, 0)
-        
-        width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        return (width, height)
+        return self._resolution if self.is_connected() else (0, 0)
 
 
 # strategies/ocr/tesseract_ocr.py
 """
 Tesseract OCR 구현체
 """
+import os
+import heapq
+import shutil
+import logging
+import tempfile
 import cv2
 import numpy as np
 import pytesseract
-from typing import List
+from typing import List, Optional, Tuple
+from config.settings import AppSettings
 from strategies.base.ocr_strategy import OCRStrategy, OCRResult
 
+# tesserocr (선택사항): 설치되어 있으면 언어 데이터를 한 번만 로드하는 API 사용
+try:
+    from tesserocr import PyTessBaseAPI, RIL, iterate_level
+except ImportError:
+    PyTessBaseAPI = None
+
+log = logging.getLogger(__name__)
+
 
 class TesseractOCR(OCRStrategy):
     """Tesseract를 사용한 OCR 구현체"""
     
-    def __init__(self, language: str = 'kor+eng'):
+    # 표본 표준편차가 이 값을 넘으면 이미 대비가 충분하다고 보고 노이즈 제거/이진화 생략
+    HIGH_CONTRAST_STD = 80.0
+    # OCR 입력 최대 높이 (더 크면 축소 - 인식 시간은 픽셀 수에 비례)
+    MAX_OCR_HEIGHT = 600
+    # 조명 불균일 보정(CLAHE) 파라미터
+    CLAHE_CLIP_LIMIT = 2.0
+    CLAHE_TILE_GRID = (8, 8)
+    
+    def __init__(self, language: str = 'kor+eng', tesseract_cmd: Optional[str] = None):
+        # tesserocr API 핸들 (없으면 pytesseract CLI 사용)
+        # 이후 초기화 중 예외가 나도 __del__/release가 참조할 수 있도록 가장 먼저 설정
+        self.api = None
         self.language = language
-        # Tesseract 실행 파일 경로 설정 (Windows의 경우)
-        # pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
+        # Tesseract 실행 파일 경로 설정 (의존성 검사에서 찾은 경로)
+        if tesseract_cmd:
+            pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+        # 엔진 확인/언어 목록은 처음 필요할 때 한 번만 조회하여 보관
+        self._available: Optional[bool] = None
+        self._langs: Optional[List[str]] = None
+        # OpenCL(T-API)은 설정으로 켠 경우에만 사용 (OpenCV가 이미 활성화한 경우)
+        self._use_opencl = AppSettings.OCR_USE_OPENCL and cv2.ocl.useOpenCL()
+        # CLAHE 객체는 이미지 간 상태가 없으므로 한 번만 생성하여 재사용
+        self._clahe = cv2.createCLAHE(clipLimit=self.CLAHE_CLIP_LIMIT,
+                                      tileGridSize=self.CLAHE_TILE_GRID)
+        
+        # 언어 데이터를 tmpfs로 복사 (설정 시) - 환경 변수 대신 엔진 호출에 경로를 직접 전달
+        tessdata_dir = self._setup_tessdata_tmpfs() if AppSettings.TESSDATA_TMPFS else None
+        self._tess_config = f'--tessdata-dir "{tessdata_dir}"' if tessdata_dir else ''
+        
+        if PyTessBaseAPI is not None:
+            try:
+                if tessdata_dir:
+                    self.api = PyTessBaseAPI(path=tessdata_dir, lang=self.language)
+                else:
+                    self.api = PyTessBaseAPI(lang=self.language)
+            except Exception:
+                log.exception("tesserocr 초기화 실패 - pytesseract 사용")
+    
+    def _setup_tessdata_tmpfs(self) -> Optional[str]:
+        """
+        사용 언어의 traineddata를 tmpfs로 복사
+        (부팅 후 첫 OCR의 디스크 읽기 지연 방지, 원본보다 새 파일만 다시 복사)
+        Returns:
+            Optional[str]: 복사된 tessdata 경로 (사용할 수 없으면 None)
+        """
+        target_dir = AppSettings.TESSDATA_TMPFS_DIR
+        if not os.path.isdir(os.path.dirname(target_dir)):
+            return None
+        
+        files = [f"{lang}.traineddata" for lang in self.language.split('+')]
+        source_dir = next((d for d in AppSettings.get_tessdata_paths()
+                           if all(os.path.isfile(os.path.join(d, f)) for f in files)), None)
+        if source_dir is None or os.path.abspath(source_dir) == os.path.abspath(target_dir):
+            return None
+        
+        try:
+            os.makedirs(target_dir, exist_ok=True)
+            for name in files:
+                src = os.path.join(source_dir, name)
+                dst = os.path.join(target_dir, name)
+                if not os.path.exists(dst) or os.path.getmtime(src) > os.path.getmtime(dst):
+                    shutil.copy2(src, dst)
+        except OSError:
+            log.exception("tessdata tmpfs 복사 실패 - 원본 경로 사용")
+            return None
+        
+        return target_dir
     
     def extract_text(self, image: np.ndarray) -> List[OCRResult]:
         """이미지에서 텍스트 추출"""
@@ -93,28 +265,20 @@ class TesseractOCR(OCRStrategy):
             return []
         
         try:
-            # 이미지 전처리
-            processed_image = self.preprocess_image(image)
-            
-            # OCR 수행 (신뢰도 포함)
-            data = pytesseract.image_to_data(
-                processed_image, 
-                lang=self.language, 
-                output_type=pytesseract.Output.DICT
-            )
+            # 이미지 전처리 (이진 이미지는 1비트로 넘겨 Tesseract 내부 이진화를 건너뜀)
+            processed_image, is_binary, scale = self._preprocess(image)
             
-            results = []
-            texts = []
+            # OCR 수행 (단어별 결과, 신뢰도 포함)
+            if self.api is not None:
+                results = self._recognize_with_api(processed_image, is_binary)
+            else:
+                results = self._recognize_with_cli(processed_image, is_binary)
             
-            # 단어별 결과 수집
-            for i in range(len(data['text'])):
-                text = data['text'][i].strip()
-                confidence = float(data['conf'][i])
-                
-                if text and confidence > 30:  # 신뢰도 30% 이상만
-                    bbox = [data['left'][i], data['top'][i], data['width'][i], data['height'][i]]
-                    results.append(OCRResult(text, confidence, bbox))
-                    texts.append(text)
+            # 축소된 좌표를 원본 이미지 좌표로 변환
+            if scale != 1.0:
+                for r in results:
+                    r.bbox = [int(round(v / scale)) for v in r.bbox]
+            texts = [r.text for r in results]
             
             # 전체 텍스트도 추가
             if texts:
@@ -122,48 +286,157 @@ class TesseractOCR(OCRStrategy):
                 overall_confidence = sum(r.confidence for r in results) / len(results) if results else 0
                 results.insert(0, OCRResult(full_text, overall_confidence))
             
-            # 신뢰도 순으로 정렬
-            results.sort(key=lambda x: x.confidence, reverse=True)
+            # 신뢰도 상위 후보만 정렬하여 유지
+            results = heapq.nlargest(AppSettings.MAX_OCR_RESULTS, results, key=lambda x: x.confidence)
             
             return results
             
-        except Exception as e:
-            print(f"OCR 처리 중 오류: {e}")
+        except Exception:
+            log.exception("OCR 처리 중 오류")
             return []
     
+    def _recognize_with_api(self, processed_image: np.ndarray, is_binary: bool) -> List[OCRResult]:
+        """tesserocr API로 단어별 인식 (최소 신뢰도 이상만)"""
+        h, w = processed_image.shape[:2]
+        if is_binary:
+            # 1비트 이미지 (비트 1 = 흰색), Tesseract의 Otsu 이진화 생략
+            packed = np.packbits(processed_image > 127, axis=1)
+            self.api.SetImageBytes(packed.tobytes(), w, h, 0, packed.shape[1])
+        else:
+            gray = np.ascontiguousarray(processed_image)
+            self.api.SetImageBytes(gray.tobytes(), w, h, 1, w)
+        self.api.Recognize()
+        
+        results = []
+        ri = self.api.GetIterator()
+        if ri is None:
+            return results
+        
+        for word in iterate_level(ri, RIL.WORD):
+            text = (word.GetUTF8Text(RIL.WORD) or '').strip()
+            confidence = float(word.Confidence(RIL.WORD))
+            
+            if text and confidence > AppSettings.MIN_OCR_CONFIDENCE:
+                x1, y1, x2, y2 = word.BoundingBox(RIL.WORD)
+                results.append(OCRResult(text, confidence, [x1, y1, x2 - x1, y2 - y1]))
+        
+        return results
+    
+    def _recognize_with_cli(self, processed_image: np.ndarray, is_binary: bool) -> List[OCRResult]:
+        """pytesseract(CLI)로 단어별 인식 (최소 신뢰도 이상만)"""
+        if is_binary:
+            # 이진 이미지는 1비트 PBM 파일로 넘겨 Tesseract의 Otsu 이진화 생략
+            fd, pbm_path = tempfile.mkstemp(suffix='.pbm')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    success, buf = cv2.imencode('.pbm', processed_image, [int(cv2.IMWRITE_PXM_BINARY), 1])
+                    if not success:
+                        raise RuntimeError("PBM 인코딩 실패")
+                    f.write(buf.tobytes())
+                data = pytesseract.image_to_data(
+                    pbm_path, 
+                    lang=self.language, 
+                    config=self._tess_config,
+                    output_type=pytesseract.Output.DICT
+                )
+            finally:
+                os.remove(pbm_path)
+        else:
+            data = pytesseract.image_to_data(
+                processed_image, 
+                lang=self.language, 
+                config=self._tess_config,
+                output_type=pytesseract.Output.DICT
+            )
+        
+        # 배열로 한 번에 필터링 (빈 텍스트 제외, 최소 신뢰도 이상만)
+        conf = np.asarray(data['conf'], dtype=np.float32)
+        txt = np.char.strip(np.asarray(data['text'], dtype=str))
+        idx = np.flatnonzero((conf > AppSettings.MIN_OCR_CONFIDENCE) & (np.char.str_len(txt) > 0))
+        
+        boxes = np.column_stack([np.asarray(data[k], dtype=np.int64)[idx]
+                                 for k in ('left', 'top', 'width', 'height')])
+        return [OCRResult(text, confidence, bbox)
+                for text, confidence, bbox in zip(txt[idx].tolist(), conf[idx].tolist(), boxes.tolist())]
+    
     def preprocess_image(self, image: np.ndarray) -> np.ndarray:
         """OCR 전 이미지 전처리"""
-        # 그레이스케일 변환
-        if len(image.shape) == 3:
+        return self._preprocess(image)[0]
+    
+    def _preprocess(self, image: np.ndarray) -> Tuple[np.ndarray, bool, float]:
+        """
+        OCR 전 이미지 전처리
+        Returns:
+            Tuple[np.ndarray, bool, float]: (전처리된 이미지, 0/255 이진 이미지 여부,
+                                             축소 비율 - bbox를 원본 좌표로 되돌릴 때 사용)
+        """
+        # 그레이스케일 변환 (이미 단일 채널이면 생략)
+        if image.ndim == 3:
             gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         else:
             gray = image
         
+        # 최대 높이를 넘으면 축소
+        h = gray.shape[0]
+        scale = self.MAX_OCR_HEIGHT / max(h, self.MAX_OCR_HEIGHT)
+        if scale < 1.0:
+            gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        
+        # 대비가 이미 높은 이미지는 그대로 사용 (8픽셀 간격 표본으로 판단)
+        if np.std(gray[::8, ::8]) > self.HIGH_CONTRAST_STD:
+            return gray, False, scale
+        
+        # OpenCL 사용 시 UMat으로 처리 (Otsu 임계값 계산은 히스토그램을 위해 호스트로 내려받음)
+        src = cv2.UMat(gray) if self._use_opencl else gray
+        
+        # 조명 불균일 보정 (국소 히스토그램 평활화)
+        equalized = self._clahe.apply(src)
+        
         # 노이즈 제거
-        denoised = cv2.medianBlur(gray, 5)
+        denoised = cv2.GaussianBlur(equalized, (3, 3), 0)
         
         # 이진화
         _, binary = cv2.threshold(denoised, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        if self._use_opencl:
+            binary = binary.get()
         
-        return binary
+        return binary, True, scale
     
     def is_available(self) -> bool:
-        """OCR 엔진 사용 가능 여부 확인"""
+        """OCR 엔진 사용 가능 여부 확인 (결과는 한 번만 확인 후 재사용)"""
+        if self._available is not None:
+            return self._available
+        
+        if self.api is not None:
+            self._available = True
+            return self._available
+        
         try:
             # 간단한 테스트 이미지로 확인
             test_image = np.ones((100, 100), dtype=np.uint8) * 255
-            pytesseract.image_to_string(test_image)
-            return True
+            pytesseract.image_to_string(test_image, config=self._tess_config)
+            self._available = True
         except Exception:
-            return False
+            self._available = False
+        return self._available
     
     def get_supported_languages(self) -> List[str]:
-        """지원하는 언어 목록 반환"""
-        try:
-            langs = pytesseract.get_languages()
-            return langs
-        except Exception:
-            return ['eng', 'kor']  # 기본값
+        """지원하는 언어 목록 반환 (결과는 한 번만 조회 후 재사용)"""
+        if self._langs is None:
+            try:
+                self._langs = pytesseract.get_languages(config=self._tess_config)
+            except Exception:
+                self._langs = ['eng', 'kor']  # 기본값
+        return list(self._langs)
+    
+    def release(self) -> None:
+        """tesserocr API 핸들 해제"""
+        if self.api is not None:
+            self.api.End()
+            self.api = None
+    
+    def __del__(self):
+        self.release()
 
 
 # strategies/storage/dropbox_local.py
@@ -172,16 +445,35 @@ Dropbox 로컬 동기화 폴더 저장 구현체
 """
 import cv2
 import os
+import logging
+import tempfile
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import numpy as np
 from strategies.base.storage_strategy import StorageStrategy, StorageResult
 
+log = logging.getLogger(__name__)
+
+# 기본 JPEG 품질
+DEFAULT_JPEG_QUALITY = 90
+# 파일 쓰기 버퍼 크기
+_WRITE_BUFFER_SIZE = 64 * 1024
+# 새 파일 권한 (umask 적용) - umask는 프로세스 전역이므로 저장 스레드가 돌기 전 로드 시 한 번만 읽음
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_FILE_MODE = 0o666 & ~_UMASK
+
 
 class DropboxLocal(StorageStrategy):
     """Dropbox 로컬 동기화 폴더에 저장하는 구현체"""
     
-    def __init__(self, dropbox_path: Optional[str] = None):
+    def __init__(self, dropbox_path: Optional[str] = None, jpeg_quality: int = DEFAULT_JPEG_QUALITY):
+        # JPEG 인코딩 파라미터 (저장마다 다시 만들지 않음)
+        self._jpeg_params = [int(cv2.IMWRITE_JPEG_QUALITY), jpeg_quality]
+        # 마지막 인코딩 결과 (이미지 배열, 확장자, 바이트)
+        # 쓰기 실패 후 같은 촬영 이미지를 다시 저장할 때 재인코딩 생략
+        self._last_encoded: Optional[Tuple[np.ndarray, str, bytes]] = None
+        
         if dropbox_path:
             self.base_path = Path(dropbox_path)
         else:
@@ -205,19 +497,23 @@ class DropboxLocal(StorageStrategy):
                 self.base_path.mkdir(exist_ok=True)
     
     def save_image(self, image: np.ndarray, file_path: str, 
-                   metadata: Optional[Dict[str, Any]] = None) -> StorageResult:
+                   metadata: Optional[Dict[str, Any]] = None,
+                   subdir: Optional[str] = None) -> StorageResult:
         """이미지 저장"""
         try:
-            full_path = self.get_full_path(file_path)
+            if subdir:
+                full_path = os.path.join(self.base_path, subdir, file_path)
+            else:
+                full_path = self.get_full_path(file_path)
             full_path_obj = Path(full_path)
             
             # 디렉토리 생성
             full_path_obj.parent.mkdir(parents=True, exist_ok=True)
             
-            # 이미지 저장
-            success = cv2.imwrite(str(full_path_obj), image)
-            
-            if success:
+            # 이미지 인코딩 후 저장
+            data = self._encode_image(image, full_path_obj.suffix or '.jpg')
+            if data is not None:
+                self._write_atomic(full_path_obj, data)
                 return StorageResult(
                     success=True,
                     file_path=str(full_path_obj),
@@ -235,14 +531,59 @@ class DropboxLocal(StorageStrategy):
                 error_message=f"저장 중 오류: {str(e)}"
             )
     
+    def _encode_image(self, image: np.ndarray, ext: str) -> Optional[bytes]:
+        """
+        이미지 인코딩
+        촬영 이미지는 저장 후 수정되지 않으므로 같은 배열 객체면 마지막 결과를 재사용
+        (픽셀 해시를 계산하지 않음)
+        """
+        ext = ext.lower()
+        last = self._last_encoded
+        if last is not None and last[0] is image and last[1] == ext:
+            return last[2]
+        
+        params = self._jpeg_params if ext in ('.jpg', '.jpeg') else []
+        success, buf = cv2.imencode(ext, image, params)
+        if not success:
+            return None
+        data = buf.tobytes()
+        
+        # 튜플 한 번의 대입이므로 저장 스레드끼리 잠금 없이 교체
+        self._last_encoded = (image, ext, data)
+        return data
+    
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        """
+        같은 폴더의 임시 파일에 쓴 뒤 최종 이름으로 교체
+        동기화 클라이언트에는 완성된 파일 하나가 생성되는 것으로 보임
+        """
+        # 임시 파일명은 저장마다 고유 (같은 최종 파일명으로 동시에 저장해도 충돌하지 않음)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.~', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                f.write(data)
+                # 교체 전에 디스크에 기록 (중단 시 최종 이름에 빈/부분 파일이 남지 않도록)
+                f.flush()
+                os.fsync(f.fileno())
+            # mkstemp는 소유자 전용(0600)으로 만들므로 umask를 적용한 일반 파일 권한으로 맞춤
+            os.chmod(tmp_path, _FILE_MODE)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+    
     def create_directory(self, dir_path: str) -> bool:
         """디렉토리 생성"""
         try:
             full_path = Path(self.get_full_path(dir_path))
             full_path.mkdir(parents=True, exist_ok=True)
             return True
-        except Exception as e:
-            print(f"디렉토리 생성 실패: {e}")
+        except Exception:
+            log.exception("디렉토리 생성 실패")
             return False
     
     def exists(self, file_path: str) -> bool:
@@ -268,6 +609,16 @@ import re
 from datetime import datetime
 from typing import Optional, Dict, Any
 from strategies.base.filename_strategy import FilenameStrategy, FilenameComponents
+from utils.date_utils import DateUtils
+
+
+# 파일명 관련 정규식 (모듈 로드 시 한 번만 컴파일)
+_FORBIDDEN_RE = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+_WS_RE = re.compile(r'\s+')
+_PARSE_RE = re.compile(r'^(.+?)_(\d{6})_([^_]+)_(.+)$')
+_EXT_RE = re.compile(r'\.jpe?g$', re.IGNORECASE)
+# 정제가 필요 없는 텍스트 (금지 문자 없음, 단어 사이 공백 하나, 앞뒤 공백 없음)
+_SAFE_RE = re.compile(r'[^<>:"/\\|?*\x00-\x1f\s]+(?: [^<>:"/\\|?*\x00-\x1f\s]+)*')
 
 
 class StandardNaming(FilenameStrategy):
@@ -285,7 +636,7 @@ class StandardNaming(FilenameStrategy):
             timestamp = datetime.now()
         
         # 날짜 형식: yymmdd
-        date_str = timestamp.strftime("%y%m%d")
+        date_str = DateUtils.get_date_string(timestamp)
         
         # 사용자명과 OCR 내용 정제
         clean_user = self.sanitize_text(user)
@@ -306,20 +657,22 @@ class StandardNaming(FilenameStrategy):
             timestamp = datetime.now()
         
         # 형식: "YY년 MM월"
-        folder_name = timestamp.strftime("%y년 %m월")
-        return folder_name
+        return DateUtils.get_folder_name(timestamp)
     
     def sanitize_text(self, text: str) -> str:
         """파일명에 사용할 수 없는 문자 제거/변환"""
         if not text:
             return "Unknown"
         
+        # 이미 안전한 텍스트는 그대로 사용
+        if _SAFE_RE.fullmatch(text):
+            return text
+        
         # 파일명에 사용할 수 없는 문자들 제거
-        forbidden_chars = r'[<>:"/\\|?*\x00-\x1f]'
-        sanitized = re.sub(forbidden_chars, '', text)
+        sanitized = _FORBIDDEN_RE.sub('', text)
         
         # 연속된 공백을 하나로 변경
-        sanitized = re.sub(r'\s+', ' ', sanitized)
+        sanitized = _WS_RE.sub(' ', sanitized)
         
         # 앞뒤 공백 제거
         sanitized = sanitized.strip()
@@ -340,8 +693,7 @@ class StandardNaming(FilenameStrategy):
             return False
         
         # 금지된 문자 검사
-        forbidden_chars = r'[<>:"/\\|?*\x00-\x1f]'
-        if re.search(forbidden_chars, filename):
+        if _FORBIDDEN_RE.search(filename):
             return False
         
         # 확장자 검사
@@ -354,11 +706,10 @@ class StandardNaming(FilenameStrategy):
         """파일명에서 구성 요소 추출"""
         try:
             # 확장자 제거
-            name_without_ext = filename.replace('.jpg', '').replace('.JPG', '')
+            name_without_ext = _EXT_RE.sub('', filename)
             
             # 패턴 매칭: prefix_yymmdd_user_content
-            pattern = r'^(.+?)_(\d{6})_([^_]+)_(.+)$'
-            match = re.match(pattern, name_without_ext)
+            match = _PARSE_RE.match(name_without_ext)
             
             if match:
                 prefix, date_str, user, content = match.groups()
@@ -3,16 +3,17 @@
 PyQt5 기반 메인 윈도우 UI
 """
 import sys
+import time
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                             QPushButton, QLabel, QComboBox, QTextEdit, QGroupBox,
                             QGridLayout, QMessageBox, QListWidget, QSplitter,
-                            QFrame, QApplication)
-from PyQt5.QtCore import QTimer, Qt, pyqtSignal
+                            QFrame, QSizePolicy)
+from PyQt5.QtCore import QTimer, Qt, pyqtSignal, QObject, QThread
 from PyQt5.QtGui import QPixmap, QImage, QFont
-import cv2
 import numpy as np
 from typing import List, Optional
 
+from config.settings import AppSettings
 from controllers.ui_controller import UIController
 from strategies.base.ocr_strategy import OCRResult
 
@@ -26,26 +27,62 @@ class CameraWidget(QLabel):
         self.setStyleSheet("border: 2px solid gray; background-color: black;")
         self.setAlignment(Qt.AlignCenter)
         self.setText("카메라 연결 중...")
-        self.setScaledContents(True)
+        # 표시 크기에 맞춘 스케일링은 프레임 갱신/크기 변경 시에만 수행
+        self.setScaledContents(False)
+        self.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+        self._source_pixmap: Optional[QPixmap] = None
+        self._transform = Qt.FastTransformation
     
-    def update_frame(self, frame: np.ndarray):
-        """카메라 프레임 업데이트"""
+    def update_frame(self, frame: np.ndarray, smooth: bool = False):
+        """
+        카메라 프레임 업데이트
+        Args:
+            frame: 표시할 프레임 (BGR 형식)
+            smooth: True이면 부드러운 보간으로 스케일링 (촬영 이미지용)
+        """
         if frame is not None:
-            # BGR to RGB 변환
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            h, w, ch = rgb_frame.shape
+            # BGR 버퍼를 변환 없이 그대로 QImage로 사용
+            frame = np.ascontiguousarray(frame)
+            h, w, ch = frame.shape
             bytes_per_line = ch * w
             
-            # QImage 생성
-            qt_image = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
+            # QImage 생성 (frame 버퍼를 참조하며 복사하지 않음)
+            qt_image = QImage(frame.data, w, h, bytes_per_line, QImage.Format_BGR888)
             
-            # QPixmap으로 변환하여 표시
-            pixmap = QPixmap.fromImage(qt_image)
-            self.setPixmap(pixmap)
+            # QPixmap으로 변환하여 위젯 크기에 맞게 표시 (이 시점에 픽셀이 복사됨)
+            self._source_pixmap = QPixmap.fromImage(qt_image)
+            self._transform = Qt.SmoothTransformation if smooth else Qt.FastTransformation
+            self._show_scaled()
+    
+    def _show_scaled(self):
+        """현재 프레임을 위젯 크기에 맞춰 한 번 스케일링하여 표시"""
+        if self._source_pixmap is None:
+            return
+        self.setPixmap(self._source_pixmap.scaled(self.contentsRect().size(),
+                                                  Qt.KeepAspectRatio, self._transform))
+    
+    def resizeEvent(self, event):
+        """위젯 크기 변경 시 현재 프레임 다시 스케일링"""
+        super().resizeEvent(event)
+        self._show_scaled()
     
     def show_captured_image(self, image: np.ndarray):
         """촬영된 이미지 표시"""
-        self.update_frame(image)
+        self.update_frame(image, smooth=True)
+
+
+class OcrWorker(QObject):
+    """OCR을 UI 스레드 밖에서 수행하는 워커"""
+    
+    finished = pyqtSignal(list)
+    
+    def __init__(self, controller: UIController):
+        super().__init__()
+        self.controller = controller
+    
+    def run(self):
+        """현재 이미지 OCR 수행 후 결과 전달"""
+        self.finished.emit(self.controller.analyze_image_ocr())
 
 
 class OCRResultWidget(QWidget):
@@ -79,15 +116,18 @@ class OCRResultWidget(QWidget):
     
     def update_results(self, results: List[OCRResult]):
         """OCR 결과 업데이트"""
+        results = results[:AppSettings.MAX_OCR_RESULTS]
+        items = [f"[{r.confidence:.1f}%] {r.text}" for r in results]
+        
+        # 목록을 한 번에 교체 (레이아웃/다시 그리기 1회)
+        self.result_list.setUpdatesEnabled(False)
         self.result_list.clear()
+        self.result_list.addItems(items)
+        self.result_list.setUpdatesEnabled(True)
         
-        for i, result in enumerate(results):
-            display_text = f"[{result.confidence:.1f}%] {result.text}"
-            self.result_list.addItem(display_text)
-            
-            # 첫 번째 결과를 자동 선택
-            if i == 0:
-                self.text_edit.setText(result.text)
+        # 첫 번째 결과를 자동 선택
+        if results:
+            self.text_edit.setText(results[0].text)
     
     def on_result_selected(self, item):
         """OCR 결과 선택 시"""
@@ -105,10 +145,19 @@ class OCRResultWidget(QWidget):
 class MainWindow(QMainWindow):
     """메인 윈도우"""
     
+    # 몇 틱마다 타이머 간격을 다시 계산할지
+    TIMER_ADJUST_TICKS = 30
+    
     def __init__(self, controller: UIController):
         super().__init__()
         self.controller = controller
         self.timer = QTimer()
+        self._frame_cost = 0.0  # 프레임 갱신 비용 이동 평균 (초)
+        self._tick_count = 0
+        self._ocr_thread: Optional[QThread] = None
+        self._ocr_worker: Optional[OcrWorker] = None
+        # 촬영 이미지를 표시하는 동안에는 실시간 화면을 그리지 않음 (저장 또는 다시 촬영 시 재개)
+        self._preview_paused = False
         self.init_ui()
         self.setup_timer()
     
@@ -211,13 +260,29 @@ class MainWindow(QMainWindow):
     def setup_timer(self):
         """타이머 설정"""
         self.timer.timeout.connect(self.update_camera)
-        self.timer.start(30)  # 30ms마다 업데이트 (약 33 FPS)
+        self.timer.start(AppSettings.CAMERA_UPDATE_INTERVAL)  # 30ms마다 업데이트 (약 33 FPS)
+    
+    def adjust_timer_interval(self, cost: float):
+        """프레임 갱신 비용에 맞춰 타이머 간격 조정 (틱이 밀리지 않도록)"""
+        self._frame_cost = 0.9 * self._frame_cost + 0.1 * cost
+        self._tick_count += 1
+        if self._tick_count >= self.TIMER_ADJUST_TICKS:
+            self._tick_count = 0
+            interval = max(AppSettings.CAMERA_UPDATE_INTERVAL, int(self._frame_cost * 1200))
+            if interval != self.timer.interval():
+                self.timer.setInterval(interval)
     
     def update_camera(self):
         """카메라 화면 업데이트"""
+        self.check_save_results()
+        if self._preview_paused:
+            return
+        
+        start = time.perf_counter()
         frame = self.controller.get_camera_frame()
         if frame is not None:
             self.camera_widget.update_frame(frame)
+            self.adjust_timer_interval(time.perf_counter() - start)
             if self.status_label.text() == "카메라 준비 중...":
                 self.status_label.setText("카메라 연결됨")
                 self.status_label.setStyleSheet("color: green; font-weight: bold;")
@@ -227,29 +292,69 @@ class MainWindow(QMainWindow):
                 self.status_label.setStyleSheet("color: red; font-weight: bold;")
     
     def capture_photo(self):
-        """사진 촬영"""
+        """사진 촬영 (촬영 이미지를 표시 중이면 폐기하고 실시간 화면으로 복귀)"""
+        if self._preview_paused:
+            self.controller.discard_capture()
+            self.ocr_widget.result_list.clear()
+            self.ocr_widget.text_edit.clear()
+            self.save_button.setEnabled(False)
+            self.resume_preview()
+            self.status_label.setText("카메라 연결됨")
+            self.status_label.setStyleSheet("color: green; font-weight: bold;")
+            return
+        
         if self.controller.capture_photo():
-            # 촬영된 이미지 표시
+            # 촬영된 이미지 표시 (저장하거나 다시 촬영할 때까지 유지)
             captured_image = self.controller.get_current_image()
             if captured_image is not None:
                 self.camera_widget.show_captured_image(captured_image)
+                self._preview_paused = True
+                self.capture_button.setText("다시 촬영")
                 
-                # OCR 수행
+                # OCR 수행 (백그라운드 스레드, 완료 시 _on_ocr_done 호출)
                 self.status_label.setText("OCR 분석 중...")
                 self.status_label.setStyleSheet("color: orange; font-weight: bold;")
-                
-                # UI 업데이트를 위해 잠시 대기
-                QApplication.processEvents()
-                
-                ocr_results = self.controller.analyze_image_ocr()
-                self.ocr_widget.update_results(ocr_results)
-                
-                self.save_button.setEnabled(True)
-                self.status_label.setText("촬영 완료 - 저장 가능")
-                self.status_label.setStyleSheet("color: green; font-weight: bold;")
+                self.capture_button.setEnabled(False)
+                self.save_button.setEnabled(False)
+                self.start_ocr()
         else:
             QMessageBox.warning(self, "오류", "사진 촬영에 실패했습니다.")
     
+    def start_ocr(self):
+        """OCR 워커 스레드 시작"""
+        self._ocr_thread = QThread()
+        self._ocr_worker = OcrWorker(self.controller)
+        self._ocr_worker.moveToThread(self._ocr_thread)
+        
+        self._ocr_thread.started.connect(self._ocr_worker.run)
+        self._ocr_worker.finished.connect(self._on_ocr_done)
+        self._ocr_worker.finished.connect(self._ocr_thread.quit)
+        # 스레드가 실제로 끝난 뒤에 버튼을 다시 켜고 Qt 쪽에서 객체 정리
+        self._ocr_thread.finished.connect(self._on_ocr_thread_finished)
+        self._ocr_thread.finished.connect(self._ocr_worker.deleteLater)
+        self._ocr_thread.finished.connect(self._ocr_thread.deleteLater)
+        
+        self._ocr_thread.start()
+    
+    def resume_preview(self):
+        """실시간 카메라 화면 재개"""
+        self._preview_paused = False
+        self.capture_button.setText("사진 촬영")
+    
+    def _on_ocr_done(self, ocr_results: List[OCRResult]):
+        """OCR 완료 시"""
+        self.ocr_widget.update_results(ocr_results)
+    
+    def _on_ocr_thread_finished(self):
+        """OCR 스레드 종료 시 (다음 촬영 가능)"""
+        self._ocr_thread = None
+        self._ocr_worker = None
+        
+        self.capture_button.setEnabled(True)
+        self.save_button.setEnabled(True)
+        self.status_label.setText("촬영 완료 - 저장 가능")
+        self.status_label.setStyleSheet("color: green; font-weight: bold;")
+    
     def save_photo(self):
         """사진 저장"""
         user = self.user_combo.currentText()
@@ -267,25 +372,45 @@ class MainWindow(QMainWindow):
                 return
             ocr_content = "NoText"
         
-        self.status_label.setText("저장 중...")
-        self.status_label.setStyleSheet("color: orange; font-weight: bold;")
-        
         if self.controller.save_photo(user, ocr_content):
-            QMessageBox.information(self, "성공", "사진이 성공적으로 저장되었습니다.")
-            self.status_label.setText("저장 완료")
-            self.status_label.setStyleSheet("color: green; font-weight: bold;")
+            # 저장은 백그라운드에서 진행, 결과는 check_save_results에서 표시
+            self.status_label.setText("저장 중...")
+            self.status_label.setStyleSheet("color: orange; font-weight: bold;")
             
-            # 저장 후 초기화
+            # 중복 저장 방지 (OCR 내용은 결과가 나올 때까지 유지, 촬영은 계속 가능)
             self.save_button.setEnabled(False)
-            self.ocr_widget.result_list.clear()
-            self.ocr_widget.text_edit.clear()
         else:
             QMessageBox.critical(self, "오류", "사진 저장에 실패했습니다.")
             self.status_label.setText("저장 실패")
             self.status_label.setStyleSheet("color: red; font-weight: bold;")
     
+    def check_save_results(self):
+        """백그라운드 저장 결과 확인"""
+        for result in self.controller.get_save_results():
+            # 이후에 새로 촬영했다면 화면 상태는 새 촬영 것이므로 건드리지 않음
+            is_current = self.controller.is_current_capture(result)
+            if result.success:
+                self.status_label.setText("저장 완료")
+                self.status_label.setStyleSheet("color: green; font-weight: bold;")
+                
+                # 저장 후 초기화 (실시간 화면으로 복귀)
+                if is_current:
+                    self.ocr_widget.result_list.clear()
+                    self.ocr_widget.text_edit.clear()
+                    self.resume_preview()
+            else:
+                self.status_label.setText("저장 실패")
+                self.status_label.setStyleSheet("color: red; font-weight: bold;")
+                # 같은 이미지와 OCR 내용으로 다시 저장할 수 있도록 복원
+                if is_current:
+                    self.save_button.setEnabled(True)
+                QMessageBox.critical(self, "오류", f"사진 저장에 실패했습니다.\n{result.error_message}")
+    
     def closeEvent(self, event):
         """윈도우 종료 시"""
         self.timer.stop()
+        if self._ocr_thread is not None:
+            self._ocr_thread.quit()
+            self._ocr_thread.wait()
         self.controller.release_resources()
         event.accept()